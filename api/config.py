@@ -25,10 +25,10 @@ class DatabaseConfig(BaseModel):
     url: str
     echo: bool = False
     # 连接池配置
-    pool_size: int = 5  # 连接池大小
+    pool_size: int = 20  # 连接池大小
     max_overflow: int = 10  # 最大溢出连接数
     pool_timeout: int = 30  # 连接池超时时间（秒）
-    pool_recycle: int = 1800  # 连接回收时间（秒）
+    pool_recycle: int = 3600  # 连接回收时间（秒）
 
 
 class JWTConfig(BaseModel):
@@ -81,6 +81,10 @@ def get_config() -> AppConfig:
     # Database configuration
     db_url = os.getenv("DB_URL", "sqlite+aiosqlite:///./easy_mcp.db")
     db_echo = os.getenv("DB_ECHO", "False").lower() == "true"
+    db_pool_size = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "3600"))
 
     # JWT configuration
     jwt_secret = os.getenv("JWT_SECRET_KEY", "easy_mcp_secret")
@@ -109,7 +113,14 @@ def get_config() -> AppConfig:
         title=app_name,
         version=app_version,
         description=app_description,
-        database=DatabaseConfig(url=db_url, echo=db_echo),
+        database=DatabaseConfig(
+            url=db_url,
+            echo=db_echo,
+            pool_size=db_pool_size,
+            max_overflow=db_max_overflow,
+            pool_timeout=db_pool_timeout,
+            pool_recycle=db_pool_recycle,
+        ),
         jwt=JWTConfig(
             secret_key=jwt_secret,
             algorithm=jwt_algorithm,
@@ -71,13 +71,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI to get a database session.
 
+    Declared as an async generator so that FastAPI awaits it directly
+    instead of running it in the threadpool.
+
     Yields:
         AsyncSession: Database session
     """
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    async with get_session() as session:
+        yield session
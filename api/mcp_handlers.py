@@ -0,0 +1,65 @@
+"""
+Shared MCP server handlers.
+
+This module builds MCP servers with the tool listing and execution handlers
+registered exactly once, so the SSE and Streamable HTTP routers only differ in
+how they resolve the tag filter for the current request.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import mcp.types as types
+from mcp.server.lowlevel import Server
+from mcp.shared.context import RequestContext
+
+from api.database import get_session
+from api.services.mcp_service import MCPService
+
+# Create logger
+logger = logging.getLogger(__name__)
+
+# Resolves the tag filter from the MCP request context
+TagGetter = Callable[[RequestContext], Optional[str]]
+
+
+def build_server(server_name: str, tag_getter: TagGetter) -> Server:
+    """
+    Build an MCP server with tool handlers registered.
+
+    Args:
+        server_name: MCP server name
+        tag_getter: Callable returning the tag filter for the current request
+
+    Returns:
+        MCP server instance
+    """
+    server = Server(server_name)
+
+    @server.list_tools()
+    async def list_tools() -> List[types.Tool]:
+        """List available tools for this connection."""
+        tag = tag_getter(server.request_context)
+
+        # Serve from cache without opening a session when possible
+        cached_tools = await MCPService.get_cached_tools(tag)
+        if cached_tools is not None:
+            return cached_tools
+
+        # Use a short-lived session so that no pool connection is held
+        # for the lifetime of the connection
+        async with get_session() as db:
+            service = MCPService(db)
+            return await service.load_tools(tag)
+
+    @server.call_tool()
+    async def call_tool(
+        name: str, arguments: Dict[str, Any]
+    ) -> List[types.TextContent]:
+        """Handle tool execution for this connection."""
+        # Use a short-lived session scoped to this tool call
+        async with get_session() as db:
+            service = MCPService(db)
+            return await service.call_tool(name, arguments)
+
+    return server
@@ -6,23 +6,20 @@ It supports both general tool listing and tag-filtered tool listing with concurr
 
 Features:
 - Concurrent-safe design with per-connection handlers
-- Automatic pagination for large tool sets
+- Single-query loading of enabled tools
 - Tag-based tool filtering
 - Comprehensive error handling and logging
 """
 
 import logging
 from contextvars import ContextVar
-from typing import Dict, Any, List
+from typing import Optional
 
-import mcp.types as types
-from fastapi import APIRouter, Request, Depends, BackgroundTasks
-from mcp.server.lowlevel import Server
+from fastapi import APIRouter, Request
 from mcp.server.sse import SseServerTransport
-from sqlalchemy.ext.asyncio import AsyncSession
+from mcp.shared.context import RequestContext
 
-from api.database import get_db, get_session
-from api.services.mcp_service import MCPService
+from api.mcp_handlers import build_server
 
 # Create logger
 logger = logging.getLogger(__name__)
@@ -31,62 +28,55 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["mcp-sse"])
 
 # Initialize MCP transport
+# The transport streams through sse_starlette's EventSourceResponse, which
+# already sends keep-alive pings and disables proxy buffering
 mcp_sse_transport = SseServerTransport("/messages/")
 
-# Initialize MCP server
-mcp_sse_server = Server("Easy MCP SSE Server")
-
-_db_ctx = ContextVar("mcp_sse_db_ctx")
+# Tag filter of the SSE connection. MCP requests arrive on the separate
+# /messages/ POST endpoint, so the tag cannot be read from their scope and is
+# instead inherited from the GET /sse-{tag} connection that runs the server.
 _tag_ctx = ContextVar("mcp_sse_tag_ctx", default=None)
 
 
-@mcp_sse_server.list_tools()
-async def list_tools() -> List[types.Tool]:
-    """List available tools for this connection."""
-    # Access lifespan context
-    # 注意：这里不再直接使用_db_ctx中的数据库会话
-    # 而是在需要时创建临时会话
-    tag = _tag_ctx.get(None)
-    
-    # 创建临时数据库会话
-    async with get_session() as db:
-        service = MCPService(db)
-        return await service.list_tools(tag)
+def _get_tag(ctx: RequestContext) -> Optional[str]:
+    """Get the tag filter of the current SSE connection."""
+    return _tag_ctx.get()
 
 
-@mcp_sse_server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
-    """Handle tool execution for this connection."""
-    # 注意：这里不再直接使用_db_ctx中的数据库会话
-    # 而是在需要时创建临时会话
-    
-    # 创建临时数据库会话
-    async with get_session() as db:
-        service = MCPService(db)
-        return await service.call_tool(name, arguments)
+# Initialize MCP server
+mcp_sse_server = build_server("Easy MCP SSE Server", _get_tag)
 
 
-async def _handle_request(request: Request):
+async def _handle_request(request: Request, tag: Optional[str] = None):
     """
     Handle SSE connection with the given MCP server.
 
     This is a helper function to reduce code duplication between
     the general and tag-filtered SSE endpoints.
 
+    The tag filter is bound to the context only for the duration of this
+    request and reset afterwards, so it never leaks into other requests
+    served by the same context.
+
     Args:
         request: FastAPI request object
+        tag: Optional tag name to filter tools by
     """
-    async with mcp_sse_transport.connect_sse(
-            request.scope,
-            request.receive,
-            request._send
-    ) as streams:
-        # Run the MCP server with the streams
-        await mcp_sse_server.run(
-            streams[0],  # read stream
-            streams[1],  # write stream
-            mcp_sse_server.create_initialization_options(),
-        )
+    token = _tag_ctx.set(tag)
+    try:
+        async with mcp_sse_transport.connect_sse(
+                request.scope,
+                request.receive,
+                request._send
+        ) as streams:
+            # Run the MCP server with the streams
+            await mcp_sse_server.run(
+                streams[0],  # read stream
+                streams[1],  # write stream
+                mcp_sse_server.create_initialization_options(),
+            )
+    finally:
+        _tag_ctx.reset(token)
 
 
 # FastAPI endpoints
@@ -103,9 +93,6 @@ async def handle_sse_endpoint(
     Args:
         request: FastAPI request object
     """
-    # 不再需要设置数据库上下文，因为我们会在需要时创建临时会话
-    _tag_ctx.set(None)
-    
     # Handle SSE connection
     await _handle_request(request)
 
@@ -125,11 +112,8 @@ async def handle_sse_endpoint_with_tag(
         tag: Tag name to filter tools by
         request: FastAPI request object
     """
-    # 不再需要设置数据库上下文，因为我们会在需要时创建临时会话
-    _tag_ctx.set(tag)
-    
     # Handle SSE connection
-    await _handle_request(request)
+    await _handle_request(request, tag)
 
 
 @router.post("/messages/{path:path}")
@@ -145,8 +129,6 @@ async def handle_post_messages(
     Args:
         request: FastAPI request object
     """
-    # 不再需要设置数据库上下文
-    
     # Use the transport's handle_post_message ASGI application
     await mcp_sse_transport.handle_post_message(
         request.scope,
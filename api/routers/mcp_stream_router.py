@@ -6,7 +6,7 @@ It supports both general tool listing and tag-filtered tool listing with session
 
 Features:
 - Session-based design with StreamableHTTPSessionManager
-- Automatic pagination for large tool sets
+- Single-query loading of enabled tools
 - Tag-based tool filtering
 - Comprehensive error handling and logging
 - Streamable HTTP session management for better performance
@@ -14,17 +14,13 @@ Features:
 """
 
 import logging
-from contextvars import ContextVar
-from typing import Dict, Any, List
+from typing import Optional
 
-import mcp.types as types
-from fastapi import APIRouter, Request, Depends
-from mcp.server.lowlevel import Server
+from fastapi import APIRouter, Request
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
-from sqlalchemy.ext.asyncio import AsyncSession
+from mcp.shared.context import RequestContext
 
-from api.database import get_db, get_session
-from api.services.mcp_service import MCPService
+from api.mcp_handlers import build_server
 
 # Create logger
 logger = logging.getLogger(__name__)
@@ -32,8 +28,16 @@ logger = logging.getLogger(__name__)
 # Create FastAPI router
 router = APIRouter(tags=["mcp-stream"])
 
+
+def _get_tag(ctx: RequestContext) -> Optional[str]:
+    """Get the tag filter from the path of the current HTTP request."""
+    if ctx.request is None:
+        return None
+    return ctx.request.path_params.get("tag")
+
+
 # Initialize MCP server
-mcp_stream_server = Server("Easy MCP Streamable HTTP Server")
+mcp_stream_server = build_server("Easy MCP Streamable HTTP Server", _get_tag)
 
 # Initialize session manager with proper parameters
 # Note: Session manager lifecycle is managed in main.py lifespan
@@ -43,43 +47,14 @@ mcp_stream_session_manager = StreamableHTTPSessionManager(
     stateless=True,
 )
 
-# Context variables for database and tag filtering
-_db_ctx = ContextVar("mcp_stream_db_ctx")
-_tag_ctx = ContextVar("mcp_stream_tag_ctx", default=None)
-
-
-@mcp_stream_server.list_tools()
-async def list_tools() -> List[types.Tool]:
-    """List available tools for this connection."""
-    # Access context variables
-    # 注意：这里不再直接使用_db_ctx中的数据库会话
-    # 而是在需要时创建临时会话
-    tag = _tag_ctx.get(None)
-    
-    # 创建临时数据库会话
-    async with get_session() as db:
-        service = MCPService(db)
-        return await service.list_tools(tag)
-
-
-@mcp_stream_server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
-    """Handle tool execution for this connection."""
-    # 注意：这里不再直接使用_db_ctx中的数据库会话
-    # 而是在需要时创建临时会话
-    
-    # 创建临时数据库会话
-    async with get_session() as db:
-        service = MCPService(db)
-        return await service.call_tool(name, arguments)
-
 
 async def _handle_request(request: Request):
     """
     Handle Streamable HTTP connection using StreamableHTTPSessionManager.
 
     This is a helper function to reduce code duplication between
-    the general and tag-filtered stream endpoints.
+    the general and tag-filtered stream endpoints. The tag filter is
+    resolved by the MCP handlers from the request path parameters.
 
     Args:
         request: FastAPI request object
@@ -110,9 +85,6 @@ async def handle_stream_endpoint(
     Args:
         request: FastAPI request object
     """
-    # 不再需要设置数据库上下文，因为我们会在需要时创建临时会话
-    _tag_ctx.set(None)
-    
     # Handle stream connection
     await _handle_request(request)
 
@@ -133,8 +105,5 @@ async def handle_stream_endpoint_with_tag(
         tag: Tag name to filter tools by
         request: FastAPI request object
     """
-    # 不再需要设置数据库上下文，因为我们会在需要时创建临时会话
-    _tag_ctx.set(tag)
-    
     # Handle stream connection
     await _handle_request(request)
\ No newline at end of file
@@ -13,6 +13,7 @@ from api.models.tb_user import TbUser
 from api.schemas.common_schema import Response
 from api.schemas.openapi_schema import OpenApi
 from api.schemas.tool_schema import ToolResponse
+from api.services.mcp_service import MCPService
 from api.services.openapi_service import OpenApiService
 from api.utils.security_util import get_current_user
 
@@ -74,6 +75,7 @@ async def import_openapi(
         apis=import_data.apis,
         current_user=current_user.username,
     )
+    MCPService.invalidate()
 
     # Convert to response
     tool_responses = [ToolResponse.model_validate(tool) for tool in tools]
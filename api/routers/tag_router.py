@@ -16,6 +16,7 @@ from api.schemas.tag_schema import (
     TagResponse,
     TagWithToolCount,
 )
+from api.services.mcp_service import MCPService
 from api.services.tag_service import TagService
 from api.utils.security_util import get_current_user
 
@@ -158,6 +159,7 @@ async def update_tag(
     """
     service = TagService(db)
     tag = await service.update_tag(tag_id, tag_data, current_user.username)
+    MCPService.invalidate()
 
     return Response(data=TagResponse.model_validate(tag.__dict__))
 
@@ -181,5 +183,6 @@ async def delete_tag(
     """
     service = TagService(db)
     await service.delete_tag(tag_id, current_user.username)
+    MCPService.invalidate()
 
     return Response(data=None, message="Tag deleted successfully")
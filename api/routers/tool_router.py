@@ -27,6 +27,7 @@ from api.schemas.tool_schema import (
     ToolMcpExecuteRequest,
 )
 from api.schemas.tag_schema import TagResponse, ToolTagRequest
+from api.services.mcp_service import MCPService
 from api.services.tool_service import ToolService
 from api.utils.security_util import get_current_user
 
@@ -105,6 +106,7 @@ async def create_tool(
     """
     service = ToolService(db)
     tool = await service.create_tool(tool_data, current_user.username)
+    MCPService.invalidate()
 
     return Response(data=ToolResponse.model_validate(tool))
 
@@ -128,6 +130,7 @@ async def create_and_deploy_tool(
     """
     service = ToolService(db)
     tool = await service.create_tool(tool_data, current_user.username)
+    MCPService.invalidate()
     await service.deploy_tool(tool.id, "Initial deployment", current_user.username)
 
     # Refresh tool to get updated version
@@ -186,6 +189,7 @@ async def update_tool(
     """
     service = ToolService(db)
     tool = await service.update_tool(tool_id, tool_data, current_user.username)
+    MCPService.invalidate()
 
     return Response(data=ToolResponse.model_validate(tool) if tool else None)
 
@@ -213,6 +217,7 @@ async def update_and_deploy_tool(
     """
     service = ToolService(db)
     tool = await service.update_tool(tool_id, tool_data, current_user.username)
+    MCPService.invalidate()
     await service.deploy_tool(tool_id, description, current_user.username)
 
     # Refresh tool to get updated version
@@ -276,6 +281,7 @@ async def rollback_tool(
     """
     service = ToolService(db)
     tool = await service.rollback_tool(tool_id, version, current_user.username)
+    MCPService.invalidate()
 
     return Response(data=ToolResponse.model_validate(tool))
 
@@ -299,6 +305,7 @@ async def delete_tool(
     """
     service = ToolService(db)
     tool = await service.delete_tool(tool_id, current_user.username)
+    MCPService.invalidate(deleted_tool_id=tool_id)
 
     return Response(data=ToolResponse.model_validate(tool) if tool else None)
 
@@ -414,6 +421,7 @@ async def enable_tool(
     """
     tool_service = ToolService(db)
     tool = await tool_service.toggle_tool_state(tool_id, True, current_user.username)
+    MCPService.invalidate()
     return Response(data=ToolResponse.model_validate(tool))
 
 
@@ -436,6 +444,7 @@ async def disable_tool(
     """
     tool_service = ToolService(db)
     tool = await tool_service.toggle_tool_state(tool_id, False, current_user.username)
+    MCPService.invalidate()
     return Response(data=ToolResponse.model_validate(tool))
 
 
@@ -474,6 +483,7 @@ async def import_builtin_tool(
     """
     service = ToolService(db)
     tool = await service.import_builtin_tool(import_data.tool_id, current_user.username)
+    MCPService.invalidate()
     return Response(data=ToolResponse.model_validate(tool))
 
 
@@ -587,5 +597,6 @@ async def set_tool_tags(
     """
     service = ToolService(db)
     await service.set_tool_tags(tool_id, tag_request.tag_ids, current_user.username)
+    MCPService.invalidate()
 
     return Response(data=None, message="Tags set successfully")
@@ -5,19 +5,56 @@ This service provides a reusable interface for MCP operations including
 tool listing and execution, with support for tag-based filtering.
 """
 
+import asyncio
+import functools
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 import mcp.types as types
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard json module for installs without orjson
+    orjson = None
+
 from api.services.tag_service import TagService
 from api.services.tool_service import ToolService
 
 # Create logger
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of converted MCP tools keyed by tag filter.
+# Each entry stores (tools version, expire time, tools).
+_TOOLS_CACHE: Dict[Optional[str], Tuple[int, float, List[types.Tool]]] = {}
+_TOOLS_CACHE_LOCK = asyncio.Lock()
+_TOOLS_CACHE_TTL = 60  # seconds, bounds staleness across worker processes
+_TOOLS_VERSION = 0
+
+# Parsed tool parameters keyed by tool ID, storing (updated_at, schema) so that
+# a tool's JSON Schema is only parsed again after the tool has been modified.
+_SCHEMA_CACHE: Dict[int, Tuple[Optional[int], Dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _error_text_content(error_message: str) -> types.TextContent:
+    """
+    Build an error TextContent, reusing instances for repeated messages.
+
+    Only use this for bounded messages such as tool not found or disabled;
+    free-form exception text goes through _create_error_response instead.
+
+    Args:
+        error_message: Error message to include
+
+    Returns:
+        TextContent with error message
+    """
+    return types.TextContent(type="text", text=f"Error: {error_message}")
+
 
 class MCPService:
     """
@@ -47,27 +84,65 @@ class MCPService:
         Returns:
             List of MCP Tool objects for enabled tools
         """
-        try:
-            # Get tag IDs if tag_filter is provided
-            tag_ids = await self._get_tag_ids(tag_filter) if tag_filter else None
-            if tag_filter and tag_ids is None:
-                return []  # Tag not found
+        cached_tools = await self.get_cached_tools(tag_filter)
+        if cached_tools is not None:
+            return cached_tools
+
+        return await self.load_tools(tag_filter)
+
+    async def load_tools(self, tag_filter: Optional[str] = None) -> List[types.Tool]:
+        """
+        Load enabled tools from database bypassing the cache lookup, and
+        store the result in cache.
+
+        Use this when the cache has already been checked by the caller.
 
-            # Get all tools using pagination
-            all_tools = await self._get_all_tools_paginated(tag_ids)
+        Args:
+            tag_filter: Optional tag name to filter tools by
 
-            # Convert enabled tools to MCP format
+        Returns:
+            List of MCP Tool objects for enabled tools
+        """
+        version = _TOOLS_VERSION
+        try:
+            # Get all enabled tools
+            all_tools = await self._get_enabled_tools(tag_filter)
+            if tag_filter and not all_tools:
+                if not await self._tag_exists(tag_filter):
+                    return []  # Tag not found
+
+            # Convert tools to MCP format
             mcp_tools = self._convert_tools_to_mcp_format(all_tools)
 
             # Log results
             self._log_tool_loading_results(mcp_tools, all_tools, tag_filter)
 
+            await self._store_cached_tools(tag_filter, version, mcp_tools)
+
             return mcp_tools
 
         except Exception as e:
             logger.error(f"Error getting enabled tools: {e}")
             return []
 
+    @staticmethod
+    def invalidate(deleted_tool_id: Optional[int] = None) -> None:
+        """
+        Invalidate cached MCP tool lists.
+
+        Must be called after any change to tools or tag associations so that
+        the next list_tools call reloads from database.
+
+        Args:
+            deleted_tool_id: ID of a deleted tool whose parsed schema should
+                also be dropped
+        """
+        global _TOOLS_VERSION
+        _TOOLS_VERSION += 1
+        _TOOLS_CACHE.clear()
+        if deleted_tool_id is not None:
+            _SCHEMA_CACHE.pop(deleted_tool_id, None)
+
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """
         Execute a tool by name with given arguments.
@@ -83,10 +158,10 @@ class MCPService:
             # Get tool by name
             tool = await self._tool_service.get_tool_by_name(name)
             if not tool:
-                return [self._create_error_response(f"Tool '{name}' not found")]
+                return [_error_text_content(f"Tool '{name}' not found")]
 
             if not tool.is_enabled:
-                return [self._create_error_response(f"Tool '{name}' is disabled")]
+                return [_error_text_content(f"Tool '{name}' is disabled")]
 
             # Execute tool
             result, logs = await self._tool_service.execute_tool(
@@ -101,64 +176,94 @@ class MCPService:
             logger.error(f"Error executing tool {name}: {e}")
             return [self._create_error_response(f"Error executing tool: {str(e)}")]
 
-    async def _get_tag_ids(self, tag_filter: str) -> Optional[List[int]]:
+    @staticmethod
+    async def get_cached_tools(
+        tag_filter: Optional[str] = None,
+    ) -> Optional[List[types.Tool]]:
         """
-        Get tag IDs for the given tag filter.
+        Get cached MCP tools for the given tag filter.
+
+        This does not touch the database, so callers can use it to serve
+        list_tools without opening a session or building a service.
 
         Args:
-            tag_filter: Tag name to filter by
+            tag_filter: Optional tag name used as cache key
 
         Returns:
-            List of tag IDs or None if tag not found
+            Cached list of MCP tools or None if missing, stale or expired
         """
-        tag_service = TagService(self.db)
-        tag = await tag_service.get_tag_by_name(tag_filter)
-        if tag:
-            logger.info(f"Filtering tools by tag: {tag_filter} (ID: {tag.id})")
-            return [tag.id]
-        else:
-            logger.warning(f"Tag not found: {tag_filter}")
-            return None
+        async with _TOOLS_CACHE_LOCK:
+            entry = _TOOLS_CACHE.get(tag_filter)
+            if not entry:
+                return None
+
+            cached_version, expire_at, tools = entry
+            if cached_version != _TOOLS_VERSION or expire_at <= time.monotonic():
+                _TOOLS_CACHE.pop(tag_filter, None)
+                return None
 
-    async def _get_all_tools_paginated(self, tag_ids: Optional[List[int]]) -> List:
+            return tools
+
+    async def _store_cached_tools(
+        self, tag_filter: Optional[str], version: int, tools: List[types.Tool]
+    ) -> None:
         """
-        Get all tools using pagination to handle large datasets.
+        Store MCP tools in cache for the given tag filter.
 
-        Args:
-            tag_ids: Optional list of tag IDs to filter by
+        Tools loaded under an outdated version are not stored, since a write
+        may have happened while they were being loaded.
 
-        Returns:
-            List of all tools from database
+        Args:
+            tag_filter: Optional tag name used as cache key
+            version: Tools version read before loading
+            tools: List of MCP tools to cache
         """
-        all_tools = []
-        page = 1
-
-        while True:
-            tools, total = await self._tool_service.query_tools(
-                page=page,
-                size=100,
-                tag_ids=tag_ids
+        async with _TOOLS_CACHE_LOCK:
+            if version != _TOOLS_VERSION:
+                return
+            _TOOLS_CACHE[tag_filter] = (
+                version,
+                time.monotonic() + _TOOLS_CACHE_TTL,
+                tools,
             )
 
-            if not tools:
-                break
+    async def _tag_exists(self, tag_filter: str) -> bool:
+        """
+        Check whether the given tag exists.
+
+        Args:
+            tag_filter: Tag name to check
 
-            all_tools.extend(tools)
+        Returns:
+            True if tag exists, False otherwise
+        """
+        tag_service = TagService(self.db)
+        tag = await tag_service.get_tag_by_name(tag_filter)
+        if not tag:
+            logger.warning(f"Tag not found: {tag_filter}")
+            return False
+        return True
 
-            # Check if we've got all tools
-            if len(all_tools) >= total:
-                break
+    async def _get_enabled_tools(self, tag_filter: Optional[str]) -> List:
+        """
+        Get all enabled tools in a single database round-trip.
 
-            page += 1
+        Args:
+            tag_filter: Optional tag name to filter by
 
-        return all_tools
+        Returns:
+            List of enabled tools from database
+        """
+        return await self._tool_service.list_enabled_by_tag_name(tag_filter)
 
     def _convert_tools_to_mcp_format(self, tools: List) -> List[types.Tool]:
         """
-        Convert database tools to MCP Tool format, filtering enabled tools only.
+        Convert database tools to MCP Tool format.
+
+        Disabled tools are already filtered out by the database query.
 
         Args:
-            tools: List of database tool objects
+            tools: List of enabled database tool objects
 
         Returns:
             List of MCP Tool objects
@@ -166,12 +271,11 @@ class MCPService:
         mcp_tools = []
 
         for tool in tools:
-            if not tool.is_enabled:
-                continue
-
             try:
                 # Parse parameters JSON Schema
-                parameters = self._parse_tool_parameters(tool.parameters)
+                parameters = self._parse_tool_parameters(
+                    tool.id, tool.updated_at, tool.parameters
+                )
 
                 mcp_tool = types.Tool(
                     name=tool.name,
@@ -186,24 +290,39 @@ class MCPService:
 
         return mcp_tools
 
-    def _parse_tool_parameters(self, parameters_str: Optional[str]) -> Dict[str, Any]:
+    def _parse_tool_parameters(
+        self, tool_id: int, updated_at: Optional[int], parameters_str: Optional[str]
+    ) -> Dict[str, Any]:
         """
-        Parse tool parameters JSON string.
+        Parse tool parameters JSON string, reusing the cached result if the
+        tool has not been updated since it was last parsed.
 
         Args:
+            tool_id: Tool ID
+            updated_at: Tool update time, used to detect stale cache entries
             parameters_str: JSON string of parameters
 
         Returns:
             Parsed parameters dictionary
         """
+        cached = _SCHEMA_CACHE.get(tool_id)
+        if cached and cached[0] == updated_at:
+            return cached[1]
+
         if not parameters_str:
-            return {}
+            parameters = {}
+        else:
+            try:
+                if orjson is not None:
+                    parameters = orjson.loads(parameters_str)
+                else:
+                    parameters = json.loads(parameters_str)
+            except ValueError as e:
+                logger.warning(f"Invalid JSON in tool parameters: {e}")
+                parameters = {}
 
-        try:
-            return json.loads(parameters_str)
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in tool parameters: {e}")
-            return {}
+        _SCHEMA_CACHE[tool_id] = (updated_at, parameters)
+        return parameters
 
     def _log_tool_loading_results(self, mcp_tools: List[types.Tool], all_tools: List, tag_filter: Optional[str]):
         """
@@ -214,13 +333,20 @@ class MCPService:
             all_tools: List of all tools from database
             tag_filter: Optional tag filter used
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         if tag_filter:
             logger.info(
-                f"Loaded {len(mcp_tools)} enabled tools for tag '{tag_filter}' "
-                f"(total: {len(all_tools)})"
+                "Loaded %d enabled tools for tag '%s' (total: %d)",
+                len(mcp_tools),
+                tag_filter,
+                len(all_tools),
             )
         else:
-            logger.info(f"Loaded {len(mcp_tools)} enabled tools (total: {len(all_tools)})")
+            logger.info(
+                "Loaded %d enabled tools (total: %d)", len(mcp_tools), len(all_tools)
+            )
 
     def _create_error_response(self, error_message: str) -> types.TextContent:
         """
@@ -250,6 +376,15 @@ class MCPService:
         if isinstance(result, str):
             return result
         
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                # Fall back to json for values orjson rejects (e.g. big ints)
+                pass
+
         try:
             return json.dumps(result, indent=2, ensure_ascii=False)
         except (TypeError, ValueError):
@@ -156,6 +156,33 @@ class ToolService:
 
         return list(tools), total
 
+    async def list_enabled_by_tag_name(
+        self, tag_name: Optional[str] = None
+    ) -> List[TbTool]:
+        """
+        List all enabled tools in a single query without pagination,
+        optionally filtered by tag name.
+
+        Args:
+            tag_name: Tag name to filter by
+
+        Returns:
+            List[TbTool]: List of enabled tools
+        """
+        query = select(TbTool).where(TbTool.is_enabled == True)
+
+        # Apply tag filter, joining through the tag table so that the
+        # tag name lookup and the tool query share one round-trip
+        if tag_name:
+            query = (
+                query.join(TbToolTag, TbTool.id == TbToolTag.tool_id)
+                .join(TbTag, TbTag.id == TbToolTag.tag_id)
+                .where(TbTag.name == tag_name)
+            )
+
+        result = await self.db.execute(query.order_by(desc(TbTool.id)))
+        return list(result.scalars().all())
+
     def _load_function_code(self, file_path: str) -> str:
         """
         Load function code from file.